@@ -8,7 +8,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from homeassistant.components import mqtt
 from homeassistant.const import Platform
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryNotReady
 
 from .coordinator import PetlibroCoordinator
@@ -16,7 +18,8 @@ from .ha_plaf301 import FEEDING_PLAN_SERVICE, PLAF301, FoodPlan
 from .ha_plwf116 import PLWF116
 from .shared_const import (
     _LOGGER,
-    TZ_OFFSET,
+    TOPIC_MODEL_WILDCARD,
+    tz_offset_hours,
 )
 from .shared_const import (
     DOMAIN as DOMAIN,
@@ -41,6 +44,42 @@ FOUNTAIN_PLATFORMS: list[Platform] = [
 ]
 
 
+async def _async_ensure_model_subscription(hass: HomeAssistant, model: str) -> None:
+    """Subscribe once per device model to the shared wildcard topic.
+
+    One broker subscription serves every device of a model; messages are
+    routed to the right device in Python via the serial number embedded in
+    the topic. This keeps broker filter entries at one per model instead of
+    three per device.
+
+    Args:
+        hass: Home Assistant instance
+        model: Device model identifier
+    """
+    domain_data = hass.data[DOMAIN]
+    if model in domain_data["model_unsubs"]:
+        return
+
+    devices: dict = domain_data["devices"]
+
+    @callback
+    def _route_message(msg) -> None:
+        # Topic layout: dl/<model>/<sn>/device/<subtopic...>
+        parts = msg.topic.split("/", 4)
+        if len(parts) < 5:  # noqa: PLR2004
+            return
+        device = devices.get(parts[2])
+        if device is not None:
+            device.route_message(parts[4], msg)
+
+    domain_data["model_unsubs"][model] = await mqtt.async_subscribe(
+        hass,
+        TOPIC_MODEL_WILDCARD.format(model=model),
+        _route_message,
+        encoding="utf-8",
+    )
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Petlibro integration from a config entry.
 
@@ -63,6 +102,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("No serial number provided in config entry")
         return False
 
+    device = None
     try:
         # Create device instance based on type
         if device_type == "feeder":
@@ -75,7 +115,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             _LOGGER.error("Unknown device type: %s", device_type)
             return False
 
-        # Start MQTT subscriptions and get device info
+        # Register the device for topic routing and make sure the shared
+        # per-model MQTT subscription exists
+        domain_data = hass.data.setdefault(DOMAIN, {"devices": {}, "model_unsubs": {}})
+        domain_data["devices"][device.serial_number] = device
+        await _async_ensure_model_subscription(hass, device.model)
+
+        # Start the device handler
         await device.start()
 
         # Create coordinator for this device
@@ -101,6 +147,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     except Exception as err:
         _LOGGER.exception("Failed to set up Petlibro integration: %s", err)
+        # Unwind the routing registration: async_unload_entry never runs for
+        # a never-ready entry, so leaving the device (and the shared model
+        # subscription, if this was its only device) registered would leak
+        # them for the process lifetime
+        domain_data = hass.data.get(DOMAIN)
+        if device is not None and domain_data:
+            domain_data["devices"].pop(device.serial_number, None)
+            model = device.model
+            if not any(d.model == model for d in domain_data["devices"].values()):
+                unsub = domain_data["model_unsubs"].pop(model, None)
+                if unsub:
+                    unsub()
         raise ConfigEntryNotReady from err
 
 
@@ -161,6 +219,12 @@ async def async_options_updated(
 
     _LOGGER.debug("Processing %d feeding schedules", len(feeding_schedules))
 
+    # Resolve the offset once for the whole batch
+    tz_offset = tz_offset_hours()
+
+    # Collect the valid plans and hand them to the service in one call
+    new_plans: list[FoodPlan] = []
+
     for idx, schedule in enumerate(feeding_schedules):
         # Validate schedule has required fields
         if "time" not in schedule or "portions" not in schedule:
@@ -201,18 +265,19 @@ async def async_options_updated(
                 continue
 
             # Convert local time to UTC by subtracting timezone offset
-            utc_hours = (hours - int(TZ_OFFSET)) % 24
+            utc_hours = (hours - tz_offset) % 24
             utc_time_str = f"{utc_hours:02d}:{minutes:02d}"
 
             # Get planId if it exists (for updates), otherwise None (new plan)
             plan_id = schedule.get("planId")
 
-            food_plan = FoodPlan(
-                grainNum=portions,
-                executionTime=utc_time_str,
-                planId=plan_id,
+            new_plans.append(
+                FoodPlan(
+                    grainNum=portions,
+                    executionTime=utc_time_str,
+                    planId=plan_id,
+                )
             )
-            feeding_plan.add_plan(food_plan)
 
             _LOGGER.debug(
                 "Added plan %d: local=%s, utc=%s, portions=%d, planId=%s",
@@ -227,6 +292,8 @@ async def async_options_updated(
             _LOGGER.warning("Error processing schedule %d (%s): %s", idx, schedule, e)
             continue
 
+    feeding_plan.extend_plans(new_plans)
+
     _LOGGER.debug(
         "Updating feeding plan with %d schedules: %s",
         len(feeding_plan.plans),
@@ -271,6 +338,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Clean up device
         await device.cleanup()
 
+        # Deregister from topic routing; drop the shared model subscription
+        # once the last device of that model is gone
+        domain_data = hass.data.get(DOMAIN)
+        if domain_data:
+            domain_data["devices"].pop(device.serial_number, None)
+            model = device.model
+            if not any(d.model == model for d in domain_data["devices"].values()):
+                unsub = domain_data["model_unsubs"].pop(model, None)
+                if unsub:
+                    unsub()
+
         _LOGGER.info("Successfully unloaded Petlibro integration")
 
     return unload_ok
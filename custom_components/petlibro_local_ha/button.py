@@ -1,10 +1,9 @@
 """Button platform for Petlibro integration."""
 
-from typing import Any
-
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -22,10 +21,7 @@ async def async_setup_entry(
     coordinator: PetlibroCoordinator = runtime_data["coordinator"]
     device = runtime_data["device"]
 
-    async_add_entities(
-        [PetlibroDispenseButton(coordinator, entry, device, portions=1)],
-        update_before_add=True,
-    )
+    async_add_entities([PetlibroDispenseButton(coordinator, entry, device, portions=1)])
 
 
 class PetlibroDispenseButton(CoordinatorEntity, ButtonEntity):
@@ -33,6 +29,9 @@ class PetlibroDispenseButton(CoordinatorEntity, ButtonEntity):
 
     _attr_has_entity_name = True
 
+    # Coordinator keys this entity renders; used by the dirty-key filter
+    _watched_keys = frozenset({"is_online"})
+
     def __init__(
         self,
         coordinator: PetlibroCoordinator,
@@ -46,9 +45,8 @@ class PetlibroDispenseButton(CoordinatorEntity, ButtonEntity):
         self._portions = portions
 
         # Set unique ID and name based on portions
-        self._attr_unique_id = (
-            f"{entry.data['petlibro_serial_number']}_dispense_{portions}"
-        )
+        sn = entry.data["petlibro_serial_number"]
+        self._attr_unique_id = f"{sn}_dispense_{portions}"
 
         if portions == 1:
             self._attr_name = "Dispense Food"
@@ -57,22 +55,30 @@ class PetlibroDispenseButton(CoordinatorEntity, ButtonEntity):
             self._attr_name = f"Dispense {portions} Portions"
             self._attr_icon = "mdi:bowl-outline"
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._device.serial_number)},
-            "name": self._device.name,
-            "manufacturer": self._device.manufacturer,
-            "model": self._device.model,
-        }
+        # Built once: every field is immutable after startup, and HA reads
+        # _attr_device_info directly when no property overrides it
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device.serial_number)},
+            name=device.name,
+            manufacturer=device.manufacturer,
+            model=device.model,
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when a key this entity renders has changed."""
+        changed = self.coordinator.changed_keys
+        if changed is not None and not (changed & self._watched_keys):
+            return
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return False
-        return self.coordinator.data.get("is_online", False)
+        return data.get("is_online", False)
 
     async def async_press(self) -> None:
         """Handle the button press."""
@@ -12,7 +12,7 @@ from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 
-from .shared_const import _LOGGER, DEFAULT_SCAN_INTERVAL, DOMAIN, TZ_OFFSET
+from .shared_const import _LOGGER, DEFAULT_SCAN_INTERVAL, DOMAIN, tz_offset_hours
 
 # Serial number validation pattern (alphanumeric, typically 12+ characters)
 SERIAL_NUMBER_PATTERN = re.compile(r"^[A-Z0-9]{10,}$", re.IGNORECASE)
@@ -153,6 +153,9 @@ class PetlibroOptionsFlowHandler(config_entries.OptionsFlow):
             schedule = feeder.feeding_schedule
             _LOGGER.debug("Loaded existing schedule: %s", schedule)
 
+            # Resolve the offset once for the whole batch
+            tz_offset = tz_offset_hours()
+
             for plan in schedule.get("plans", []):
                 # Get values with proper defaults
                 utc_time_str = plan.get("executionTime")
@@ -173,11 +176,11 @@ class PetlibroOptionsFlowHandler(config_entries.OptionsFlow):
                 # Convert UTC time to local time
                 try:
                     hours, minutes = map(int, utc_time_str.split(":"))
-                    local_hours = (hours + int(TZ_OFFSET)) % 24
+                    local_hours = (hours + tz_offset) % 24
                     local_time_str = f"{local_hours:02d}:{minutes:02d}"
 
                     _LOGGER.debug(
-                        f"Converting: {utc_time_str} (UTC) -> {local_time_str} (local), offset={TZ_OFFSET}"
+                        f"Converting: {utc_time_str} (UTC) -> {local_time_str} (local), offset={tz_offset}"
                     )
                 except (ValueError, AttributeError) as e:
                     _LOGGER.warning("Error converting time %s: %s", utc_time_str, e)
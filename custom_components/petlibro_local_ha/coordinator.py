@@ -48,6 +48,9 @@ class PetlibroCoordinator(DataUpdateCoordinator[dict]):
             config_entry=config_entry,
             name=DOMAIN,
             update_interval=timedelta(minutes=scan_interval),
+            # The data payload is a flat dict of comparable primitives, so
+            # skip listener fan-out entirely when nothing changed
+            always_update=False,
         )
 
         self.feeder = device  # Keep this name for backward compatibility
@@ -58,6 +61,12 @@ class PetlibroCoordinator(DataUpdateCoordinator[dict]):
 
         self._state_change: bool = False
 
+        # Keys whose values changed in the latest refresh. None means
+        # "treat everything as changed" (first refresh or after a failure);
+        # entities use this to skip state writes that cannot affect them.
+        self.changed_keys: frozenset[str] | None = None
+        self._previous_data: dict | None = None
+
     async def _on_state_change(self) -> None:
         """Handle state change from device.
 
@@ -95,9 +104,26 @@ class PetlibroCoordinator(DataUpdateCoordinator[dict]):
                 self._state_change = False
 
             # Return current status
-            return self.device.get_state_dict()
+            new_data = self.device.get_state_dict()
+
+            # Work out which keys actually moved since the previous refresh.
+            # last_update_success still reflects the previous cycle here, so
+            # a recovery from a failed update wakes every entity.
+            prev = self._previous_data
+            if prev is None or not self.last_update_success:
+                self.changed_keys = None
+            else:
+                self.changed_keys = frozenset(
+                    k for k, v in new_data.items() if prev.get(k) != v
+                )
+            self._previous_data = new_data
+
+            return new_data
 
         except Exception as err:
             _LOGGER.exception("Error updating Petlibro device data")
+            # Failure affects availability everywhere; don't let entities
+            # filter the callback on stale keys
+            self.changed_keys = None
             msg = f"Error communicating with device: {err}"
             raise UpdateFailed(msg) from err
@@ -8,7 +8,8 @@ from homeassistant.components.cover import (
     CoverEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -26,10 +27,7 @@ async def async_setup_entry(
     coordinator: PetlibroCoordinator = runtime_data["coordinator"]
     device = runtime_data["device"]
 
-    async_add_entities(
-        [PLAF301CoverEntity(coordinator, entry, device)],
-        update_before_add=True,
-    )
+    async_add_entities([PLAF301CoverEntity(coordinator, entry, device)])
 
 
 class PLAF301CoverEntity(CoordinatorEntity, CoverEntity):
@@ -40,6 +38,11 @@ class PLAF301CoverEntity(CoordinatorEntity, CoverEntity):
     _attr_device_class = CoverDeviceClass.SHUTTER
     _attr_supported_features = CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE
 
+    # Coordinator keys this entity renders; used by the dirty-key filter
+    _watched_keys = frozenset(
+        {"is_online", "is_door_open", "is_door_opening", "is_door_closing"}
+    )
+
     def __init__(
         self,
         coordinator: PetlibroCoordinator,
@@ -49,46 +52,57 @@ class PLAF301CoverEntity(CoordinatorEntity, CoverEntity):
         """Initialize the cover entity."""
         super().__init__(coordinator)
         self._device = device
-        self._attr_unique_id = f"{entry.data['petlibro_serial_number']}_cover"
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._device.serial_number)},
-            "name": self._device.name,
-            "manufacturer": self._device.manufacturer,
-            "model": self._device.model,
-        }
+        sn = entry.data["petlibro_serial_number"]
+        self._attr_unique_id = f"{sn}_cover"
+        # Built once: every field is immutable after startup, and HA reads
+        # _attr_device_info directly when no property overrides it
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device.serial_number)},
+            name=device.name,
+            manufacturer=device.manufacturer,
+            model=device.model,
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when a key this entity renders has changed."""
+        changed = self.coordinator.changed_keys
+        if changed is not None and not (changed & self._watched_keys):
+            return
+        super()._handle_coordinator_update()
 
     @property
     def is_closed(self) -> bool:
         """Return if the cover is closed."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
         # Door is closed when is_door_open is False
-        return not self.coordinator.data.get("is_door_open", False)
+        return not data.get("is_door_open", False)
 
     @property
     def is_opening(self) -> bool:
         """Return if the cover is opening."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return False
-        return self.coordinator.data.get("is_door_opening", False)
+        return data.get("is_door_opening", False)
 
     @property
     def is_closing(self) -> bool:
         """Return if the cover is closing."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return False
-        return self.coordinator.data.get("is_door_closing", False)
+        return data.get("is_door_closing", False)
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return False
-        return self.coordinator.data.get("is_online", False)
+        return data.get("is_online", False)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
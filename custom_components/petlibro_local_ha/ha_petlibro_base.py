@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
+import re
+import sys
 import time
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
@@ -21,6 +24,9 @@ from .message_data import (
 from .shared_const import (
     _LOGGER,
     MANUFACTURER,
+    SUBTOPIC_CONTROL_IN,
+    SUBTOPIC_EVENT,
+    SUBTOPIC_HEARTBEAT,
     TOPIC_DEVICE_CONTROL,
     TOPIC_DEVICE_CONTROL_IN,
     TOPIC_DEVICE_EVENT,
@@ -31,13 +37,43 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from paho.mqtt.client import MQTTMessage
 
+# Fast-path matcher for heartbeat payloads, which normally only carry
+# "ts" and "rssi". Extracting both with a precompiled regex avoids a full
+# JSON parse for every heartbeat of every device.
+_HEARTBEAT_RE = re.compile(r'"ts"\s*:\s*(\d+)\s*.*?"rssi"\s*:\s*(-?\d+)', re.S)
+
 
 class PetlibroDeviceBase(ABC):
     """Base class for MQTT-enabled Petlibro devices."""
 
+    # One slot per instance attribute assigned in __init__; avoids the
+    # per-instance __dict__ and speeds attribute access on the MQTT hot path.
+    __slots__ = (
+        "_control_in_topic",
+        "_control_topic",
+        "_current_state",
+        "_event_topic",
+        "_heartbeat",
+        "_heartbeat_topic",
+        "_last_heartbeat",
+        "_last_heartbeat_time",
+        "_model",
+        "_name",
+        "_sn",
+        "_startup_info",
+        "_state_change_callback",
+        "hass",
+    )
+
     HEARTBEAT_TIMEOUT = 300
     """The maximum allowed time (in seconds) between heartbeats before considering the device offline."""
 
+    STATE_UPDATE_TIMEOUT = 10
+    """The maximum time (in seconds) to wait for the device to answer a state request."""
+
+    _EVENT_CMDS: frozenset[str] = frozenset({"ATTR_PUSH_EVENT", "DEVICE_START_EVENT"})
+    """Event commands this class handles; subclasses extend with their own."""
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -66,8 +102,12 @@ class PetlibroDeviceBase(ABC):
         self._last_heartbeat: float = 0
         self._last_heartbeat_time: float = time.time()
 
-        # MQTT unsubscribe functions
-        self._unsub_funcs: list = []
+        # Topics depend only on model and serial number, so format them once
+        # here instead of re-parsing the templates on every publish
+        self._event_topic = self._get_topic(TOPIC_DEVICE_EVENT)
+        self._control_topic = self._get_topic(TOPIC_DEVICE_CONTROL)
+        self._control_in_topic = self._get_topic(TOPIC_DEVICE_CONTROL_IN)
+        self._heartbeat_topic = self._get_topic(TOPIC_DEVICE_HEARTBEAT)
 
         # Callback for state changes
         self._state_change_callback: callable | None = None
@@ -124,22 +164,22 @@ class PetlibroDeviceBase(ABC):
     @property
     def event_topic(self) -> str:
         """Topic for receiving events."""
-        return self._get_topic(TOPIC_DEVICE_EVENT)
+        return self._event_topic
 
     @property
     def control_topic(self) -> str:
         """Topic for sending control commands."""
-        return self._get_topic(TOPIC_DEVICE_CONTROL)
+        return self._control_topic
 
     @property
     def control_in_topic(self) -> str:
         """Topic for receiving control responses."""
-        return self._get_topic(TOPIC_DEVICE_CONTROL_IN)
+        return self._control_in_topic
 
     @property
     def heartbeat_topic(self) -> str:
         """Topic for receiving heartbeat messages."""
-        return self._get_topic(TOPIC_DEVICE_HEARTBEAT)
+        return self._heartbeat_topic
 
     # ==================== Callback Management ====================
 
@@ -160,37 +200,15 @@ class PetlibroDeviceBase(ABC):
     # ==================== Lifecycle Methods ====================
 
     async def start(self) -> None:
-        """Start the device handler and subscribe to MQTT topics."""
+        """Start the device handler.
+
+        MQTT subscriptions are owned by the integration, which holds one
+        wildcard subscription per model and delivers matching messages here
+        through route_message().
+        """
         _LOGGER.info("Starting %s device: %s", self._model, self._sn)
 
         try:
-            # Subscribe to event topic
-            unsub = await mqtt.async_subscribe(
-                self.hass,
-                self.event_topic,
-                self._handle_event_message,
-                encoding="utf-8",
-            )
-            self._unsub_funcs.append(unsub)
-
-            # Subscribe to heartbeat topic
-            unsub = await mqtt.async_subscribe(
-                self.hass,
-                self.heartbeat_topic,
-                self._handle_heartbeat_message,
-                encoding="utf-8",
-            )
-            self._unsub_funcs.append(unsub)
-
-            # Subscribe to control response topic
-            unsub = await mqtt.async_subscribe(
-                self.hass,
-                self.control_in_topic,
-                self._handle_control_response,
-                encoding="utf-8",
-            )
-            self._unsub_funcs.append(unsub)
-
             # Sync time with device
             await self.sync_time()
 
@@ -210,13 +228,25 @@ class PetlibroDeviceBase(ABC):
         # Device-specific cleanup
         await self._device_specific_cleanup()
 
-        # Unsubscribe from MQTT topics
-        for unsub in self._unsub_funcs:
-            unsub()
-        self._unsub_funcs.clear()
-
     # ==================== MQTT Message Handlers ====================
 
+    @callback
+    def route_message(self, subtopic: str, msg: MQTTMessage) -> None:
+        """Dispatch a message from the shared model subscription.
+
+        Args:
+            subtopic: Topic portion below ``dl/{model}/{sn}/device/``
+            msg: MQTT message received
+        """
+        if subtopic == SUBTOPIC_EVENT:
+            self._handle_event_message(msg)
+        elif subtopic == SUBTOPIC_HEARTBEAT:
+            self._handle_heartbeat_message(msg)
+        elif subtopic == SUBTOPIC_CONTROL_IN:
+            self._handle_control_response(msg)
+        # Anything else (e.g. our own service/sub publishes echoed by the
+        # wildcard) is intentionally ignored.
+
     @callback
     def _handle_event_message(self, msg: MQTTMessage) -> None:
         """Handle incoming event messages.
@@ -226,12 +256,19 @@ class PetlibroDeviceBase(ABC):
         """
         try:
             payload: dict = json.loads(msg.payload)
-            cmd = payload.get("cmd")
+            # Interning gives identity-speed comparisons against the literal
+            # command names below; the frozenset rejects unknown commands
+            # with a single hash lookup.
+            cmd = sys.intern(payload.get("cmd") or "")
+            if cmd not in self._EVENT_CMDS:
+                _LOGGER.warning("Unknown event command: %s", cmd)
+                return
             update: bool = True
 
             if cmd == "ATTR_PUSH_EVENT":
                 self._current_state.from_mqtt_payload(payload)
-                _LOGGER.debug("Updated device attributes")
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Updated device attributes")
 
             elif cmd == "DEVICE_START_EVENT":
                 self._startup_info.from_mqtt_payload(payload)
@@ -240,16 +277,15 @@ class PetlibroDeviceBase(ABC):
             else:
                 # Let subclass handle device-specific events
                 update = self._handle_device_specific_event(cmd, payload)
-                if not update:
-                    _LOGGER.warning("Unknown event command: %s", cmd)
 
             # Notify callback of state change
             if self._state_change_callback and update:
-                _LOGGER.debug("Updating values from state change")
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Updating values from state change")
                 self.hass.async_create_task(self._state_change_callback())
 
-        except Exception as err:
-            _LOGGER.exception("Error handling event message: %s", err)
+        except (ValueError, KeyError, TypeError, AttributeError) as err:
+            _LOGGER.warning("Bad event payload on %s: %s", msg.topic, err)
 
     @callback
     def _handle_heartbeat_message(self, msg: MQTTMessage) -> None:
@@ -259,22 +295,34 @@ class PetlibroDeviceBase(ABC):
             msg: MQTT message received
         """
         try:
-            payload: dict = json.loads(msg.payload)
-            self._last_heartbeat = payload.get("ts")
+            # Fast path: pull ts/rssi straight out of the raw payload and
+            # fall back to a full JSON parse only for unusual heartbeats.
+            match = _HEARTBEAT_RE.search(msg.payload)
+            if match:
+                ts = int(match.group(1))
+                self._last_heartbeat = ts
+                self._heartbeat.ts = ts
+                self._heartbeat.rssi = int(match.group(2))
+            else:
+                payload: dict = json.loads(msg.payload)
+                self._last_heartbeat = payload.get("ts")
+                self._heartbeat.from_mqtt_payload(payload)
             self._last_heartbeat_time = time.time()
-            self._heartbeat.from_mqtt_payload(payload)
-            _LOGGER.debug(
-                "Received heartbeat(%s): RSSI=%s",
-                self._heartbeat.ts,
-                self._heartbeat.rssi,
-            )
+            # isEnabledFor keeps dynamic log-level changes working while still
+            # skipping debug-argument evaluation on the hot path
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Received heartbeat(%s): RSSI=%s",
+                    self._heartbeat.ts,
+                    self._heartbeat.rssi,
+                )
 
             # Trigger state update since device is online
             if self._state_change_callback:
                 self.hass.async_create_task(self._state_change_callback())
 
-        except Exception as err:
-            _LOGGER.exception("Error handling heartbeat message: %s", err)
+        except (ValueError, KeyError, TypeError, AttributeError) as err:
+            _LOGGER.warning("Bad heartbeat payload on %s: %s", msg.topic, err)
 
     @callback
     def _handle_control_response(self, msg: MQTTMessage) -> None:
@@ -293,16 +341,19 @@ class PetlibroDeviceBase(ABC):
             if not self._handle_device_specific_control_response(cmd, payload):
                 _LOGGER.warning("Unknown control response: %s", cmd)
 
-        except Exception as err:
-            _LOGGER.exception("Error handling control response: %s", err)
+        except (ValueError, KeyError, TypeError, AttributeError) as err:
+            _LOGGER.warning("Bad control response on %s: %s", msg.topic, err)
 
     # ==================== MQTT Commands ====================
 
-    async def _publish_command(self, message: Any) -> None:
+    async def _publish_command(self, message: Any, qos: int = 0) -> None:
         """Publish a command to the device.
 
         Args:
             message: Message object to publish
+            qos: MQTT quality of service; default 0 (fire-and-forget) so the
+                coroutine does not wait for a PUBACK round-trip. Pass 1 for
+                commands that need guaranteed delivery.
         """
         try:
             payload = message.to_mqtt_payload()
@@ -310,13 +361,14 @@ class PetlibroDeviceBase(ABC):
                 self.hass,
                 self.control_topic,
                 payload,
-                qos=1,
-            )
-            _LOGGER.debug(
-                "Published command: %s to topic %s",
-                message.cmd,
-                self.control_topic,
+                qos=qos,
             )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Published command: %s to topic %s",
+                    message.cmd,
+                    self.control_topic,
+                )
 
         except Exception as err:
             _LOGGER.exception("Error publishing command: %s", err)
@@ -329,12 +381,27 @@ class PetlibroDeviceBase(ABC):
         await asyncio.sleep(0.3)
 
     async def request_state_update(self) -> None:
-        """Request current state from the device."""
+        """Request current state from the device.
+
+        Raises:
+            TimeoutError: If the device does not answer within
+                STATE_UPDATE_TIMEOUT seconds.
+        """
         _LOGGER.debug("Requesting state update")
         tmp = self._heartbeat.ts
-        await self._publish_command(NTP())
-        while self._heartbeat.ts == tmp:
-            await asyncio.sleep(0.1)
+        # QoS 1: this gates every coordinator poll, and a publish dropped at
+        # QoS 0 would leave the wait below with nothing to wake it
+        await mqtt.async_publish(
+            self.hass,
+            self.control_topic,
+            NTP.STATIC_PAYLOAD,
+            qos=1,
+        )
+        # Bound the wait so a lost response fails the refresh instead of
+        # wedging the coordinator permanently
+        async with asyncio.timeout(self.STATE_UPDATE_TIMEOUT):
+            while self._heartbeat.ts == tmp:
+                await asyncio.sleep(0.1)
         _LOGGER.debug("State update done")
 
     # ==================== Abstract Methods ====================
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from typing import TYPE_CHECKING, Any
 
 from .ha_petlibro_base import PetlibroDeviceBase
@@ -28,10 +29,52 @@ from .shared_const import (
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
+# Precomputed at import so get_state_dict() resolves the HA activity with a
+# single dict lookup instead of a method call per coordinator read.
+_STATE_TO_ACTIVITY = {state: state.to_ha_activity() for state in FeederState}
+
+
+def _build_state_table() -> tuple[FeederState, ...]:
+    """Build the 16-entry state lookup table used by current_state.
+
+    The index is the packed flag key
+    ``(empty << 3) | (clogged << 2) | (dispensing << 1) | door_open``.
+
+    Returns:
+        tuple: FeederState for every flag combination
+    """
+    table = []
+    for key in range(16):
+        if key & 0b1100:  # empty or clogged
+            table.append(FeederState.ERROR)
+        elif key & 0b0010:  # dispensing
+            table.append(FeederState.DISPENSING)
+        elif key & 0b0001:  # door open
+            table.append(FeederState.DOOR_OPEN)
+        else:
+            table.append(FeederState.DOOR_CLOSED)
+    return tuple(table)
+
+
+_STATE_TABLE = _build_state_table()
+
 
 class PLAF301(PetlibroDeviceBase):
     """MQTT-enabled Petlibro PLAF301 feeder."""
 
+    __slots__ = (
+        "_door_is_closing",
+        "_door_is_opening",
+        "_door_transition_timer",
+        "_is_dispensing",
+        "_schedule",
+    )
+
+    _EVENT_CMDS = PetlibroDeviceBase._EVENT_CMDS | {
+        "WAREHOUSE_DOOR_EVENT",
+        "GRAIN_OUTPUT_EVENT",
+    }
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -91,17 +134,14 @@ class PLAF301(PetlibroDeviceBase):
     @property
     def current_state(self) -> FeederState:
         """Get the current state of the device."""
-        if self.is_empty:
-            return FeederState.ERROR
-        if self.is_clogged:
-            return FeederState.ERROR
-        if self.is_dispensing:
-            return FeederState.DISPENSING
-        if self.is_door_open:
-            return FeederState.DOOR_OPEN
-        if not self.is_door_open:
-            return FeederState.DOOR_CLOSED
-        return FeederState.UNKNOWN
+        state = self._current_state
+        key = (
+            ((not state.surplusGrain) << 3)
+            | ((not state.grainOutletState) << 2)
+            | (self._is_dispensing << 1)
+            | bool(state.barnDoorState)
+        )
+        return _STATE_TABLE[key]
 
     @property
     def error_code(self) -> str:
@@ -127,9 +167,12 @@ class PLAF301(PetlibroDeviceBase):
         Returns:
             dict: Current device state
         """
+        state = self.current_state
+        # Fresh dict per poll: the coordinator's always_update=False
+        # comparison needs distinct successive snapshots
         return {
-            "state": self.current_state,
-            "activity": self.current_state.to_ha_activity(),
+            "state": state,
+            "activity": _STATE_TO_ACTIVITY[state],
             "is_door_open": self.is_door_open,
             "is_door_opening": self.is_door_opening,
             "is_door_closing": self.is_door_closing,
@@ -162,7 +205,8 @@ class PLAF301(PetlibroDeviceBase):
         if cmd == "GRAIN_OUTPUT_EVENT":
             finished = payload.get("finished", True)
             self._is_dispensing = not finished
-            _LOGGER.debug("Dispensing: %s", self._is_dispensing)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Dispensing: %s", self._is_dispensing)
             return True
 
         return False
@@ -176,12 +220,13 @@ class PLAF301(PetlibroDeviceBase):
         door_state = payload.get("barnDoorState", False)
         trigger_type = payload.get("triggerType", "")
 
-        _LOGGER.debug(
-            "Door event: state=%s, trigger=%s, current_state=%s",
-            door_state,
-            trigger_type,
-            self._current_state.barnDoorState,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Door event: state=%s, trigger=%s, current_state=%s",
+                door_state,
+                trigger_type,
+                self._current_state.barnDoorState,
+            )
 
         # Determine if door is transitioning
         old_state = self._current_state.barnDoorState
@@ -268,20 +313,27 @@ class PLAF301(PetlibroDeviceBase):
         _LOGGER.info("Opening barn door")
         self._door_is_opening = True
         self._door_is_closing = False
-        await self._publish_command(ATTR_SET_SERVICE(coverOpen=True))
 
-        # Notify callback of state change
-        await self._notify_state_change()
+        # Publish the command and notify the callback concurrently; QoS 1
+        # because a dropped publish would leave the latched opening state
+        # pointing at a door that never moved
+        await asyncio.gather(
+            self._publish_command(ATTR_SET_SERVICE(coverOpen=True), qos=1),
+            self._notify_state_change(),
+        )
 
     async def close_door(self) -> None:
         """Close the barn door."""
         _LOGGER.info("Closing barn door")
         self._door_is_closing = True
         self._door_is_opening = False
-        await self._publish_command(ATTR_SET_SERVICE(coverOpen=False))
 
-        # Notify callback of state change
-        await self._notify_state_change()
+        # Publish the command and notify the callback concurrently; QoS 1
+        # for the same delivery guarantee as open_door
+        await asyncio.gather(
+            self._publish_command(ATTR_SET_SERVICE(coverOpen=False), qos=1),
+            self._notify_state_change(),
+        )
 
     async def toggle_door(self) -> None:
         """Toggle the barn door state."""
@@ -303,7 +355,8 @@ class PLAF301(PetlibroDeviceBase):
         _LOGGER.info("Dispensing %s portion(s)", amount)
         msg = MANUAL_FEEDING_SERVICE()
         msg.grainNum = amount
-        await self._publish_command(msg)
+        # Feeding must not be silently dropped - keep guaranteed delivery
+        await self._publish_command(msg, qos=1)
 
     # ==================== Feeding Schedule Management ====================
 
@@ -356,11 +409,11 @@ class PLAF301(PetlibroDeviceBase):
             new_plans.append(plan)
 
         # Update local state
-        self._schedule.plans = new_plans
+        self._schedule.set_plans(new_plans)
 
         try:
-            # Publish command
-            await self._publish_command(self._schedule)
+            # Publish command (schedule writes need guaranteed delivery)
+            await self._publish_command(self._schedule, qos=1)
 
             # Wait for confirmation (with timeout)
             await asyncio.sleep(1.0)  # Give device time to respond
@@ -375,5 +428,5 @@ class PLAF301(PetlibroDeviceBase):
         except Exception as e:
             # Rollback on failure
             _LOGGER.error(f"Failed to update feeding plan, rolling back: {e}")
-            self._schedule.plans = old_schedule
+            self._schedule.set_plans(old_schedule)
             raise
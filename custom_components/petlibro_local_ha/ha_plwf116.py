@@ -26,6 +26,18 @@ if TYPE_CHECKING:
 class PLWF116(PetlibroDeviceBase):
     """MQTT-enabled Petlibro PLWF116 water fountain."""
 
+    __slots__ = (
+        "_filter_life",
+        "_pump_running",
+        "_water_level",
+    )
+
+    _EVENT_CMDS = PetlibroDeviceBase._EVENT_CMDS | {
+        "PUMP_STATE_EVENT",
+        "WATER_LEVEL_EVENT",
+        "FILTER_STATUS_EVENT",
+    }
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -103,6 +115,8 @@ class PLWF116(PetlibroDeviceBase):
         Returns:
             dict: Current device state
         """
+        # Fresh dict per poll: the coordinator's always_update=False
+        # comparison needs distinct successive snapshots
         return {
             "state": self.current_state,
             "is_pump_running": self.is_pump_running,
@@ -7,43 +7,53 @@ by the Petlibro smart feeder integration.
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass, field, is_dataclass
-from datetime import UTC, datetime
+import time
+from dataclasses import dataclass, field, fields
 from typing import Any
 
-from .shared_const import _LOGGER, TZ_OFFSET
+from .shared_const import _LOGGER, tz_offset_hours
 
+# Per-class cache of dataclass field names so to_dict() does not rescan
+# the instance __dict__ (or the fields machinery) on every serialization
+_FIELD_CACHE: dict[type, tuple[str, ...]] = {}
 
-@dataclass
+
+@dataclass(slots=True)
 class MQTTMessage:
     """Base class for MQTT messages with serialization utilities."""
 
-    def to_mqtt_payload(self) -> str:
-        """Convert the message to a JSON string.
+    def to_mqtt_payload(self) -> bytes:
+        """Convert the message to JSON bytes ready for publishing.
 
         Returns:
-            JSON string representation of the message
+            UTF-8 encoded JSON representation of the message
         """
-        return json.dumps(self.to_dict())
+        return json.dumps(self.to_dict()).encode("utf-8")
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert message to dictionary, handling nested dataclasses.
+        """Convert message to dictionary.
+
+        Field names are cached per class, so repeated serialization skips
+        the dataclass reflection machinery. This fast path assumes primitive
+        field values; the only message type nesting dataclasses
+        (FEEDING_PLAN_SERVICE) overrides it.
+
         Returns:
             Dictionary representation of the message
         """
+        cls = type(self)
+        names = _FIELD_CACHE.get(cls)
+        if names is None:
+            # Underscore-prefixed fields are internal bookkeeping and are
+            # never serialized
+            names = _FIELD_CACHE[cls] = tuple(
+                f.name for f in fields(cls) if not f.name.startswith("_")
+            )
+
         result = {}
-        for key, value in self.__dict__.items():
-            if value is None:
-                continue
-            # Handle nested dataclasses
-            if is_dataclass(value):
-                result[key] = asdict(value)
-            # Handle lists of dataclasses
-            elif isinstance(value, list):
-                result[key] = [
-                    asdict(item) if is_dataclass(item) else item for item in value
-                ]
-            else:
+        for key in names:
+            value = getattr(self, key)
+            if value is not None:
                 result[key] = value
         return result
 
@@ -66,7 +76,7 @@ class MQTTMessage:
         return json.dumps(self.to_dict())
 
 
-@dataclass
+@dataclass(slots=True)
 class PetlibroMessage(MQTTMessage):
     """Base class for Petlibro-specific messages."""
 
@@ -79,7 +89,7 @@ class PetlibroMessage(MQTTMessage):
         self.cmd = self.__class__.__name__
 
 
-@dataclass
+@dataclass(slots=True)
 class GRAIN_OUTPUT_EVENT(PetlibroMessage):
     """Grain output event from device."""
 
@@ -91,7 +101,7 @@ class GRAIN_OUTPUT_EVENT(PetlibroMessage):
     execStep: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class WAREHOUSE_DOOR_EVENT(PetlibroMessage):
     """Warehouse door event from device."""
 
@@ -100,7 +110,7 @@ class WAREHOUSE_DOOR_EVENT(PetlibroMessage):
     execTime: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ATTR_PUSH_EVENT(PetlibroMessage):
     """Attribute push event from device."""
 
@@ -135,7 +145,7 @@ class ATTR_PUSH_EVENT(PetlibroMessage):
     autoThreshold: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DEVICE_START_EVENT(PetlibroMessage):
     """Device start event."""
 
@@ -147,7 +157,7 @@ class DEVICE_START_EVENT(PetlibroMessage):
     channelPlanNum: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HEARTBEAT(PetlibroMessage):
     """Heartbeat message from device."""
 
@@ -156,35 +166,43 @@ class HEARTBEAT(PetlibroMessage):
     wifiType: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MANUAL_FEEDING_SERVICE(PetlibroMessage):
     """Manual feeding command."""
 
     grainNum: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class NTP_SYNC(PetlibroMessage):
     """NTP synchronization message."""
 
     def __init__(self) -> None:
         """Set timestamp and timezone during initialization."""
-        super().__init__()
-        now = datetime.now(UTC)
-        self.ts = now.timestamp() * 1000
+        # Explicit form: slots=True recreates the class, which breaks the
+        # zero-argument super() closure in methods defined in the body
+        super(NTP_SYNC, self).__init__()
+        self.ts = time.time_ns() // 1_000_000
 
-        # Get local timezone offset
-        self.timezone = TZ_OFFSET
+        # Local timezone offset at the moment of the sync
+        self.timezone = tz_offset_hours()
 
     timezone: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class NTP(PetlibroMessage):
     """NTP request message."""
 
 
-@dataclass
+# The NTP request never varies (defaults only), so serialize it once at
+# import time; publishers can send the cached bytes without building a
+# message instance per call. NTP_SYNC carries a live timestamp and cannot
+# be cached the same way.
+NTP.STATIC_PAYLOAD = NTP().to_mqtt_payload()
+
+
+@dataclass(slots=True)
 class ATTR_SET_SERVICE(PetlibroMessage):
     """Service to set device attributes."""
 
@@ -196,12 +214,18 @@ class ATTR_SET_SERVICE(PetlibroMessage):
         Args:
             coverOpen: True to open, False to close, None for default
         """
-        super().__init__()
-        if coverOpen is not None:
+        # Explicit form: slots=True recreates the class, which breaks the
+        # zero-argument super() closure in methods defined in the body
+        super(ATTR_SET_SERVICE, self).__init__()
+        # Always assign: slotted dataclasses have no class-level default to
+        # fall back on
+        if coverOpen is None:
+            self.coverOpenMode = "KEEP_CLOSED"
+        else:
             self.coverOpenMode = "KEEP_OPEN" if coverOpen else "KEEP_CLOSED"
 
 
-@dataclass
+@dataclass(slots=True)
 class FoodPlan(MQTTMessage):
     """Single feeding plan."""
 
@@ -210,15 +234,33 @@ class FoodPlan(MQTTMessage):
     planId: int | None = None
     enableAudio: bool = False
     audioTimes: int = 0
-    syncTime: int = datetime.now().astimezone().timestamp() * 1000
+    # default_factory so each plan gets a fresh timestamp; a plain class-body
+    # default would be evaluated once at import and shared by every instance
+    syncTime: int = field(default_factory=lambda: time.time_ns() // 1_000_000)
 
 
-@dataclass
+@dataclass(slots=True)
 class FEEDING_PLAN_SERVICE(PetlibroMessage):
     """Feeding plan service message."""
 
     plans: list[FoodPlan] = field(default_factory=list)
     ts: int = -1
+    # Index of plans keyed by executionTime; kept in sync by the mutators
+    # below so update_plan is a hash lookup instead of a linear scan
+    _by_time: dict[str, FoodPlan] = field(default_factory=dict, repr=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary, expanding the nested plan list.
+
+        Returns:
+            Dictionary representation of the message
+        """
+        return {
+            "cmd": self.cmd,
+            "ts": self.ts,
+            "msgId": self.msgId,
+            "plans": [plan.to_dict() for plan in self.plans],
+        }
 
     def add_plan(self, plan: FoodPlan) -> None:
         """Add a feeding plan.
@@ -230,6 +272,25 @@ class FEEDING_PLAN_SERVICE(PetlibroMessage):
         #     # Plan IDs start at 1, not 0
         #     plan.planId = len(self.plans) + 1
         self.plans.append(plan)
+        self._by_time[plan.executionTime] = plan
+
+    def extend_plans(self, plans: list[FoodPlan]) -> None:
+        """Add several feeding plans in one call.
+
+        Args:
+            plans: The feeding plans to add
+        """
+        self.plans.extend(plans)
+        self._by_time.update((plan.executionTime, plan) for plan in plans)
+
+    def set_plans(self, plans: list[FoodPlan]) -> None:
+        """Replace the plan list and rebuild the time index.
+
+        Args:
+            plans: The new list of feeding plans
+        """
+        self.plans = plans
+        self._by_time = {plan.executionTime: plan for plan in plans}
 
     def remove_plan(self, index: int) -> FoodPlan:
         """Remove a feeding plan by index.
@@ -243,38 +304,37 @@ class FEEDING_PLAN_SERVICE(PetlibroMessage):
         Raises:
             IndexError: If index is out of range
         """
-        return self.plans.pop(index)
+        plan = self.plans.pop(index)
+        if self._by_time.get(plan.executionTime) is plan:
+            del self._by_time[plan.executionTime]
+        return plan
 
     def update_plan(self, plan: FoodPlan) -> None:
         """Update an existing feeding plan.
 
         Args:
-            plan: The feeding plan to update (must have planId set)
+            plan: The feeding plan to update (matched by executionTime)
 
         Raises:
-            ValueError: If plan has no planId
-            IndexError: If planId is invalid
+            IndexError: If no plan with the same executionTime exists
         """
-        _LOGGER.debug(f"Updating feeding plan: {plan.to_dict()}")
-        # if plan.planId is None:
-        #     msg = "Plan ID must be set for update"
-        #     raise ValueError(msg)
+        _LOGGER.debug("Updating feeding plan: %s", plan)
 
-        # Find and update the plan
-        for i, existing_plan in enumerate(self.plans):
-            _LOGGER.debug(
-                f"checking existing {self.plans[i].to_dict()} \n  against {plan.to_dict()}\n"
-            )
-            if existing_plan.executionTime == plan.executionTime:
-                _LOGGER.debug(f"updating plan: {plan.to_dict()}\n")
-                self.plans[i].executionTime = str(plan.executionTime)
-                self.plans[i].grainNum = plan.grainNum
-                self.plans[i].enableAudio = plan.enableAudio
-                self.plans[i].audioTimes = plan.audioTimes
-                return
+        index = self._by_time
+        if len(index) != len(self.plans):
+            # Rebuild in case plans was assigned without going through
+            # set_plans
+            index = self._by_time = {p.executionTime: p for p in self.plans}
+
+        existing = index.get(plan.executionTime)
+        if existing is None:
+            msg = f"Plan with Time {plan.executionTime} not found in {self.plans}"
+            raise IndexError(msg)
 
-        msg = f"Plan with Time {plan.executionTime} not found in {self.plans}"
-        raise IndexError(msg)
+        existing.executionTime = str(plan.executionTime)
+        existing.grainNum = plan.grainNum
+        existing.enableAudio = plan.enableAudio
+        existing.audioTimes = plan.audioTimes
 
     def from_mqtt_payload(self, payload: dict[str, Any]) -> FEEDING_PLAN_SERVICE:
         """Deserialize feeding plan service from payload.
@@ -289,11 +349,12 @@ class FEEDING_PLAN_SERVICE(PetlibroMessage):
         _LOGGER.debug("Deserializing FEEDING_PLAN_SERVICE from payload: %s", payload)
         plans_data = payload.get("plans", [])
         if plans_data:
-            self.plans = []
+            plans = []
             for plan_dict in plans_data:
                 plan = FoodPlan()
                 plan.from_mqtt_payload(plan_dict)
-                self.plans.append(plan)
+                plans.append(plan)
+            self.set_plans(plans)
 
         # Handle other fields
         for key, value in payload.items():
@@ -305,6 +366,6 @@ class FEEDING_PLAN_SERVICE(PetlibroMessage):
         return self
 
 
-@dataclass
+@dataclass(slots=True)
 class DEVICE_FEEDING_PLAN_SERVICE(PetlibroMessage):
     """Request feeding plan from device."""
@@ -22,14 +22,18 @@ class FeederState(Enum):
         Returns:
             VacuumActivity: Corresponding HA vacuum activity state
         """
-        state_mapping = {
-            FeederState.DISPENSING: VacuumActivity.CLEANING,
-            FeederState.ERROR: VacuumActivity.ERROR,
-            FeederState.DOOR_CLOSED: VacuumActivity.IDLE,
-            FeederState.DOOR_OPEN: VacuumActivity.DOCKED,
-            FeederState.UNKNOWN: VacuumActivity.ERROR,
-        }
-        return state_mapping.get(self, VacuumActivity.ERROR)
+        return _STATE_MAPPING.get(self, VacuumActivity.ERROR)
+
+
+# Built once at import so to_ha_activity() is a single dict lookup instead
+# of rebuilding the mapping per call
+_STATE_MAPPING = {
+    FeederState.DISPENSING: VacuumActivity.CLEANING,
+    FeederState.ERROR: VacuumActivity.ERROR,
+    FeederState.DOOR_CLOSED: VacuumActivity.IDLE,
+    FeederState.DOOR_OPEN: VacuumActivity.DOCKED,
+    FeederState.UNKNOWN: VacuumActivity.ERROR,
+}
 
 
 # Error codes
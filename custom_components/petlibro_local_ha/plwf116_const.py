@@ -16,7 +16,12 @@ class WaterFountainState(Enum):
 
     def __str__(self) -> str:
         """Return string representation."""
-        return self.name.lower()
+        return _STATE_NAMES[self]
+
+
+# Lowercase names computed once at import so __str__ does not allocate a
+# new string per call
+_STATE_NAMES = {state: state.name.lower() for state in WaterFountainState}
 
 
 # Error codes
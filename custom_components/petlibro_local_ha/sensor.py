@@ -1,19 +1,80 @@
 """Sensor platform for Petlibro integration."""
 
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import PetlibroCoordinator
-from .shared_const import DOMAIN, TZ
+from .shared_const import DOMAIN, local_tz
+
+# Status flags in priority order; the first truthy key wins. Online and the
+# Idle fallback are handled separately in native_value.
+_STATUS_TABLE = (
+    ("is_dispensing", "Dispensing"),
+    ("is_door_opening", "Door Opening"),
+    ("is_door_closing", "Door Closing"),
+    ("is_empty", "Empty"),
+    ("is_clogged", "Clogged"),
+    ("is_door_open", "Door Open"),
+)
+
+
+@lru_cache(maxsize=16)
+def _status_from_flags(is_online: bool, *flags: bool) -> str:
+    """Derive the status label from the device flags.
+
+    Pure and cached: a feeder cycles through only a handful of distinct
+    flag combinations, so repeat derivations become a dict lookup.
+
+    Args:
+        is_online: Whether the device is online
+        *flags: Truthiness of each _STATUS_TABLE key, in table order
+
+    Returns:
+        str: Status label for the flag combination
+    """
+    if not is_online:
+        return "Offline"
+    for (_, label), flag in zip(_STATUS_TABLE, flags, strict=True):
+        if flag:
+            return label
+    return "Idle"
+
+
+# (attribute name, coordinator key, default) spec for the status sensor's
+# extra attributes; extra_state_attributes builds its dict from this in one
+# comprehension instead of seven hand-written data.get lines
+_EXTRA_ATTRS = (
+    ("error_code", "error_code", "none"),
+    ("state_code", "state", None),
+    ("online", "is_online", False),
+    ("door_open", "is_door_open", False),
+    ("dispensing", "is_dispensing", False),
+    ("empty", "is_empty", False),
+    ("clogged", "is_clogged", False),
+)
+
+# Icon per status string; rebuilt dicts in the icon property added eight
+# insertions to every state write
+_STATUS_ICONS = {
+    "Offline": "mdi:cloud-off-outline",
+    "Dispensing": "mdi:food-drumstick",
+    "Door Opening": "mdi:door-open",
+    "Door Closing": "mdi:door-closed",
+    "Empty": "mdi:alert-circle-outline",
+    "Clogged": "mdi:alert-outline",
+    "Door Open": "mdi:door-open",
+    "Idle": "mdi:check-circle-outline",
+}
 
 
 async def async_setup_entry(
@@ -30,8 +91,7 @@ async def async_setup_entry(
         [
             PLAF301ConnectivitySensor(coordinator, entry, device),
             PLAF301StatusSensor(coordinator, entry, device),
-        ],
-        update_before_add=True,
+        ]
     )
 
 
@@ -41,6 +101,21 @@ class PLAF301StatusSensor(CoordinatorEntity, SensorEntity):
     _attr_has_entity_name = True
     _attr_icon = "mdi:information-outline"
 
+    # Coordinator keys this sensor renders; used by the dirty-key filter
+    _watched_keys = frozenset(
+        {
+            "is_online",
+            "is_dispensing",
+            "is_door_opening",
+            "is_door_closing",
+            "is_empty",
+            "is_clogged",
+            "is_door_open",
+            "error_code",
+            "state",
+        }
+    )
+
     def __init__(
         self,
         coordinator: PetlibroCoordinator,
@@ -50,33 +125,41 @@ class PLAF301StatusSensor(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._device = device
-        self._attr_unique_id = f"{entry.data['petlibro_serial_number']}_status"
+        sn = entry.data["petlibro_serial_number"]
+        self._attr_unique_id = f"{sn}_status"
         self._attr_name = "Status"
 
+        # Built once: every field is immutable after startup, and HA reads
+        # _attr_device_info directly when no property overrides it
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device.serial_number)},
+            name=device.name,
+            manufacturer=device.manufacturer,
+            model=device.model,
+            sw_version=getattr(device._startup_info, "softwareVersion", None) or None,
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when a key this entity renders has changed."""
+        changed = self.coordinator.changed_keys
+        if changed is not None and not (changed & self._watched_keys):
+            return
+        super()._handle_coordinator_update()
+
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        if not self.coordinator.data:
-            value: str = "Unknown"
-        # Check various states in priority order
-        elif not self.coordinator.data.get("is_online", False):
-            value = "Offline"
-        elif self.coordinator.data.get("is_dispensing", False):
-            value = "Dispensing"
-        elif self.coordinator.data.get("is_door_opening", False):
-            value = "Door Opening"
-        elif self.coordinator.data.get("is_door_closing", False):
-            value = "Door Closing"
-        elif self.coordinator.data.get("is_empty", False):
-            value = "Empty"
-        elif self.coordinator.data.get("is_clogged", False):
-            value = "Clogged"
-        elif self.coordinator.data.get("is_door_open", False):
-            value = "Door Open"
-        else:
-            value = "Idle"
-
-        return value
+        data = self.coordinator.data
+        if not data:
+            return "Unknown"
+
+        # _status_from_flags is lru_cached, so this is a handful of dict
+        # gets plus a cache lookup per read
+        return _status_from_flags(
+            bool(data.get("is_online", False)),
+            *(bool(data.get(flag, False)) for flag, _ in _STATUS_TABLE),
+        )
 
     @property
     def icon(self):
@@ -84,55 +167,23 @@ class PLAF301StatusSensor(CoordinatorEntity, SensorEntity):
         if not self.coordinator.data:
             return "mdi:help-circle-outline"
 
-        status = self.native_value
-        icon_map = {
-            "Offline": "mdi:cloud-off-outline",
-            "Dispensing": "mdi:food-drumstick",
-            "Door Opening": "mdi:door-open",
-            "Door Closing": "mdi:door-closed",
-            "Empty": "mdi:alert-circle-outline",
-            "Clogged": "mdi:alert-outline",
-            "Door Open": "mdi:door-open",
-            "Idle": "mdi:check-circle-outline",
-        }
-        return icon_map.get(status, "mdi:information-outline")
+        return _STATUS_ICONS.get(self.native_value, "mdi:information-outline")
 
     @property
     def extra_state_attributes(self):
         """Return additional state attributes."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return {}
 
-        return {
-            "error_code": self.coordinator.data.get("error_code", "none"),
-            "state_code": self.coordinator.data.get("state"),
-            "online": self.coordinator.data.get("is_online", False),
-            "door_open": self.coordinator.data.get("is_door_open", False),
-            "dispensing": self.coordinator.data.get("is_dispensing", False),
-            "empty": self.coordinator.data.get("is_empty", False),
-            "clogged": self.coordinator.data.get("is_clogged", False),
-        }
+        get = data.get
+        return {name: get(key, default) for name, key, default in _EXTRA_ATTRS}
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return self.coordinator.last_update_success
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information for device registry."""
-        return {
-            "identifiers": {(DOMAIN, self._device.serial_number)},
-            "name": self._device.name,
-            "manufacturer": self._device.manufacturer,
-            "model": self._device.model,
-            "sw_version": (
-                self._device._startup_info.softwareVersion
-                if self._device._startup_info.softwareVersion
-                else None
-            ),
-        }
-
 
 class PLAF301ConnectivitySensor(CoordinatorEntity, SensorEntity):
     """Sensor showing time since last heartbeat."""
@@ -142,6 +193,9 @@ class PLAF301ConnectivitySensor(CoordinatorEntity, SensorEntity):
     _attr_device_class = SensorDeviceClass.TIMESTAMP
     _attr_icon = "mdi:connection"
 
+    # Coordinator keys this sensor renders; used by the dirty-key filter
+    _watched_keys = frozenset({"last_seen"})
+
     def __init__(
         self,
         coordinator: PetlibroCoordinator,
@@ -151,35 +205,49 @@ class PLAF301ConnectivitySensor(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._device = device
-        self._attr_unique_id = f"{entry.data['petlibro_serial_number']}_last_heartbeat"
+        sn = entry.data["petlibro_serial_number"]
+        self._attr_unique_id = f"{sn}_last_heartbeat"
+
+        # last_seen only moves on heartbeats, while HA reads native_value far
+        # more often; keep the last (timestamp, datetime) pair to avoid
+        # constructing an identical datetime per read
+        self._last_ts: float = 0
+        self._last_dt: datetime | None = None
+        # Built once: every field is immutable after startup, and HA reads
+        # _attr_device_info directly when no property overrides it
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device.serial_number)},
+            name=device.name,
+            manufacturer=device.manufacturer,
+            model=device.model,
+            sw_version=getattr(device._startup_info, "softwareVersion", None) or None,
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when a key this entity renders has changed."""
+        changed = self.coordinator.changed_keys
+        if changed is not None and not (changed & self._watched_keys):
+            return
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
+            return None
+
+        last_seen = data.get("last_seen", 0)
+        if last_seen <= 0:
             return None
 
-        last_seen = self.coordinator.data.get("last_seen", 0)
-        if last_seen > 0:
-            return datetime.fromtimestamp(last_seen, TZ)
-        return None
+        if last_seen != self._last_ts:
+            self._last_ts = last_seen
+            self._last_dt = datetime.fromtimestamp(last_seen, local_tz())
+        return self._last_dt
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return self.coordinator.last_update_success
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information for device registry."""
-        return {
-            "identifiers": {(DOMAIN, self._device.serial_number)},
-            "name": self._device.name,
-            "manufacturer": self._device.manufacturer,
-            "model": self._device.model,
-            "sw_version": (
-                self._device._startup_info.softwareVersion
-                if self._device._startup_info.softwareVersion
-                else None
-            ),
-        }
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from datetime import datetime, tzinfo
 
 DOMAIN = "petlibro_local_ha"
 
@@ -14,6 +14,15 @@ TOPIC_DEVICE_CONTROL = "dl/{model}/{sn}/device/service/sub"
 TOPIC_DEVICE_CONTROL_IN = "dl/{model}/{sn}/device/service/post"
 TOPIC_DEVICE_HEARTBEAT = "dl/{model}/{sn}/device/heart/post"
 
+# Shared wildcard subscription covering every device of one model; the
+# integration routes matching messages to the right device in Python
+TOPIC_MODEL_WILDCARD = "dl/{model}/+/device/#"
+
+# Subtopics (relative to dl/{model}/{sn}/device/) routed to device handlers
+SUBTOPIC_EVENT = "event/post"
+SUBTOPIC_HEARTBEAT = "heart/post"
+SUBTOPIC_CONTROL_IN = "service/post"
+
 _LOGGER = logging.getLogger(__name__)
 
 # Device model
@@ -21,8 +30,20 @@ MODEL_PLAF301 = "PLAF301"
 MODEL_PLWF116 = "PLWF116"
 MANUFACTURER = "Petlibro"
 
-# Get local timezone
-TZ = datetime.now().astimezone().tzinfo
+# Timezone accessors. Resolved at call time rather than import time so the
+# module imports without building datetimes, and so a timezone change after
+# startup (DST, reconfigured host) is picked up instead of baked in.
+
+
+def local_tz() -> tzinfo | None:
+    """Return the current local timezone."""
+    return datetime.now().astimezone().tzinfo
+
+
+def tz_offset_hours() -> int:
+    """Return the local UTC offset in whole hours.
 
-# Get timezone offset in hours
-TZ_OFFSET = datetime.now().astimezone().utcoffset().total_seconds() / 3600
+    Truncates toward zero (like int() on a float) so fractional offsets
+    such as UTC-3:30 map to -3, matching the former TZ_OFFSET constant.
+    """
+    return int(datetime.now().astimezone().utcoffset().total_seconds() / 3600)
@@ -4,7 +4,8 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -22,10 +23,7 @@ async def async_setup_entry(
     coordinator: PetlibroCoordinator = runtime_data["coordinator"]
     device = runtime_data["device"]
 
-    async_add_entities(
-        [PetlibroPumpSwitch(coordinator, entry, device)],
-        update_before_add=True,
-    )
+    async_add_entities([PetlibroPumpSwitch(coordinator, entry, device)])
 
 
 class PetlibroPumpSwitch(CoordinatorEntity, SwitchEntity):
@@ -35,6 +33,18 @@ class PetlibroPumpSwitch(CoordinatorEntity, SwitchEntity):
     _attr_name = "Pump"
     _attr_icon = "mdi:pump"
 
+    # Coordinator keys this entity renders; used by the dirty-key filter
+    _watched_keys = frozenset(
+        {
+            "is_online",
+            "is_pump_running",
+            "water_level",
+            "filter_life",
+            "is_low_water",
+            "needs_filter_change",
+        }
+    )
+
     def __init__(
         self,
         coordinator: PetlibroCoordinator,
@@ -44,45 +54,53 @@ class PetlibroPumpSwitch(CoordinatorEntity, SwitchEntity):
         """Initialize the switch entity."""
         super().__init__(coordinator)
         self._device = device
-        self._attr_unique_id = f"{entry.data['petlibro_serial_number']}_pump"
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._device.serial_number)},
-            "name": self._device.name,
-            "manufacturer": self._device.manufacturer,
-            "model": self._device.model,
-        }
+        sn = entry.data["petlibro_serial_number"]
+        self._attr_unique_id = f"{sn}_pump"
+        # Built once: every field is immutable after startup, and HA reads
+        # _attr_device_info directly when no property overrides it
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device.serial_number)},
+            name=device.name,
+            manufacturer=device.manufacturer,
+            model=device.model,
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when a key this entity renders has changed."""
+        changed = self.coordinator.changed_keys
+        if changed is not None and not (changed & self._watched_keys):
+            return
+        super()._handle_coordinator_update()
 
     @property
     def is_on(self) -> bool:
         """Return true if the pump is on."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return False
-        return self.coordinator.data.get("is_pump_running", False)
+        return data.get("is_pump_running", False)
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return False
-        return self.coordinator.data.get("is_online", False)
+        return data.get("is_online", False)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return {}
 
         return {
-            "water_level": self.coordinator.data.get("water_level", 0),
-            "filter_life": self.coordinator.data.get("filter_life", 0),
-            "is_low_water": self.coordinator.data.get("is_low_water", False),
-            "needs_filter_change": self.coordinator.data.get(
-                "needs_filter_change", False
-            ),
+            "water_level": data.get("water_level", 0),
+            "filter_life": data.get("filter_life", 0),
+            "is_low_water": data.get("is_low_water", False),
+            "needs_filter_change": data.get("needs_filter_change", False),
         }
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
@@ -9,10 +10,11 @@ from homeassistant.components.vacuum import (
     StateVacuumEntity,
     VacuumEntityFeature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .shared_const import _LOGGER, DOMAIN, TZ
+from .shared_const import _LOGGER, DOMAIN, local_tz
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -20,6 +22,14 @@ if TYPE_CHECKING:
 
     from .coordinator import PetlibroCoordinator
 
+# Feature flags evaluated once at import instead of in the class body
+_SUPPORTED_FEATURES = (
+    VacuumEntityFeature.START
+    | VacuumEntityFeature.STATE
+    | VacuumEntityFeature.BATTERY
+    | VacuumEntityFeature.STATUS
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -37,23 +47,34 @@ async def async_setup_entry(
     coordinator: PetlibroCoordinator = runtime_data["coordinator"]
     device = runtime_data["device"]
 
-    async_add_entities(
-        [PetlibroVacuumEntity(coordinator, entry, device)],
-        update_before_add=True,
-    )
+    async_add_entities([PetlibroVacuumEntity(coordinator, entry, device)])
 
 
 class PetlibroVacuumEntity(CoordinatorEntity, StateVacuumEntity):
     """Representation of a Petlibro feeder as a vacuum entity."""
 
-    _attr_supported_features = (
-        VacuumEntityFeature.START
-        | VacuumEntityFeature.STATE
-        | VacuumEntityFeature.BATTERY
-        | VacuumEntityFeature.STATUS
-    )
+    _attr_supported_features = _SUPPORTED_FEATURES
     _attr_has_entity_name = True
 
+    # Coordinator keys this entity renders; used by the dirty-key filter
+    _watched_keys = frozenset(
+        {
+            "activity",
+            "is_online",
+            "is_door_open",
+            "is_door_opening",
+            "is_door_closing",
+            "is_dispensing",
+            "is_empty",
+            "is_clogged",
+            "error_code",
+            "last_seen",
+            "seconds_since_heartbeat",
+            "battery_level",
+            "rssi",
+        }
+    )
+
     def __init__(
         self,
         coordinator: PetlibroCoordinator,
@@ -70,61 +91,121 @@ class PetlibroVacuumEntity(CoordinatorEntity, StateVacuumEntity):
         super().__init__(coordinator)
 
         self._device = device
-        self._attr_unique_id = f"{entry.data['petlibro_serial_number']}_vacuum"
+        sn = entry.data["petlibro_serial_number"]
+        self._attr_unique_id = f"{sn}_vacuum"
         self._attr_name = "Feeder"
+        # Built once: every field is immutable after startup, and HA reads
+        # _attr_device_info directly when no property overrides it
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device.serial_number)},
+            name=device.name,
+            manufacturer=device.manufacturer,
+            model=device.model,
+            sw_version=getattr(device._startup_info, "softwareVersion", None) or None,
+        )
 
         self.coordinator: PetlibroCoordinator = coordinator
 
+        # Cache of the last formatted last_seen value so consecutive reads
+        # of the same coordinator payload skip the strftime
+        self._last_seen_ts: float = 0
+        self._last_seen_str: str = "Never"
+
+        # Signature of the fields rendered into HA state; used to skip
+        # async_write_ha_state when a refresh changed nothing we show
+        self._last_sig: tuple | None = None
+
+        # Attributes are rebuilt once per coordinator refresh in
+        # _handle_coordinator_update; HA reads this attribute directly
+        data = coordinator.data
+        self._attr_extra_state_attributes = self._build_attrs(data) if data else {}
+
+        # Serializes device actions so concurrent service calls cannot
+        # interleave their MQTT commands
+        self._action_lock = asyncio.Lock()
+
+    # Fields folded into the write-skip signature. seconds_since_heartbeat
+    # is deliberately absent: it ticks on every poll and is derived from
+    # last_seen, which is included.
+    _SIG_KEYS = (
+        "activity",
+        "is_online",
+        "is_door_open",
+        "is_door_opening",
+        "is_door_closing",
+        "is_dispensing",
+        "is_empty",
+        "is_clogged",
+        "error_code",
+        "last_seen",
+        "battery_level",
+        "rssi",
+    )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when a key this entity renders has changed."""
+        changed = self.coordinator.changed_keys
+        if changed is not None and not (changed & self._watched_keys):
+            return
+
+        # Second, finer guard: even when some watched key moved, skip the
+        # state-machine write if every rendered field is identical
+        data = self.coordinator.data
+        if data:
+            get = data.get
+            sig = tuple(get(key) for key in self._SIG_KEYS)
+            if sig == self._last_sig:
+                return
+            self._last_sig = sig
+            # Rebuild the attribute dict once per accepted refresh so the
+            # HA read path is a plain attribute access
+            self._attr_extra_state_attributes = self._build_attrs(data)
+
+        super()._handle_coordinator_update()
+
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
         # Device is available if coordinator has data and device is online
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return False
-        return self.coordinator.data.get("is_online", False)
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information for device registry."""
-        return {
-            "identifiers": {(DOMAIN, self._device.serial_number)},
-            "name": self._device.name,
-            "manufacturer": self._device.manufacturer,
-            "model": self._device.model,
-            "sw_version": (
-                self._device._startup_info.softwareVersion
-                if self._device._startup_info.softwareVersion
-                else None
-            ),
-        }
+        return data.get("is_online", False)
 
     @property
     def activity(self) -> str | None:
         """Return the current activity of the vacuum."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("activity")
+        data = self.coordinator.data
+        if data:
+            return data.get("activity")
         return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
+    def _build_attrs(self, data: dict) -> dict[str, Any]:
+        """Build the extra state attributes for a coordinator snapshot.
 
-        ts = datetime.fromtimestamp(datetime.now(TZ).timestamp(), TZ).strftime(
-            "%d/%m/%Y %H:%M:%S"
-        )
+        Args:
+            data: Coordinator data dict (must be non-empty)
 
-        # Get last seen timestamp
-        last_seen_ts = self.coordinator.data.get("last_seen", 0)
-        if last_seen_ts > 0:
-            last_seen = datetime.fromtimestamp(last_seen_ts, TZ).strftime(
-                "%d/%m/%Y %H:%M:%S"
+        Returns:
+            dict: Attributes to expose on the HA state
+        """
+        ts = datetime.now(local_tz()).strftime("%d/%m/%Y %H:%M:%S")
+
+        # Get last seen timestamp; reformat only when it actually moved
+        last_seen_ts = data.get("last_seen", 0)
+        if last_seen_ts != self._last_seen_ts:
+            self._last_seen_ts = last_seen_ts
+            self._last_seen_str = (
+                datetime.fromtimestamp(last_seen_ts, local_tz()).strftime(
+                    "%d/%m/%Y %H:%M:%S"
+                )
+                if last_seen_ts > 0
+                else "Never"
             )
-        else:
-            last_seen = "Never"
+        last_seen = self._last_seen_str
 
-        seconds_since = self.coordinator.data.get("seconds_since_heartbeat", -1)
+        seconds_since = data.get("seconds_since_heartbeat", -1)
         if seconds_since >= 0:
             minutes_since = seconds_since // 60
             time_since = f"{minutes_since}m {seconds_since % 60}s ago"
@@ -132,37 +213,42 @@ class PetlibroVacuumEntity(CoordinatorEntity, StateVacuumEntity):
             time_since = "Unknown"
 
         # Determine door status string
-        if self.coordinator.data.get("is_door_opening", False):
+        if data.get("is_door_opening", False):
             door_status = "Opening"
-        elif self.coordinator.data.get("is_door_closing", False):
+        elif data.get("is_door_closing", False):
             door_status = "Closing"
-        elif self.coordinator.data.get("is_door_open", False):
+        elif data.get("is_door_open", False):
             door_status = "Open"
         else:
             door_status = "Closed"
 
         return {
-            "door_open": self.coordinator.data.get("is_door_open", False),
+            "door_open": data.get("is_door_open", False),
             "door_status": door_status,
-            "dispensing": self.coordinator.data.get("is_dispensing", False),
-            "empty": self.coordinator.data.get("is_empty", False),
-            "clogged": self.coordinator.data.get("is_clogged", False),
-            "error": self.coordinator.data.get("error_code", "none"),
-            "online": self.coordinator.data.get("is_online", False),
+            "dispensing": data.get("is_dispensing", False),
+            "empty": data.get("is_empty", False),
+            "clogged": data.get("is_clogged", False),
+            "error": data.get("error_code", "none"),
+            "online": data.get("is_online", False),
             "last_seen": last_seen,
             "time_since_heartbeat": time_since,
             "Last Update": ts,
-            "Battery": self.coordinator.data.get("battery_level"),
-            "RSSI": self.coordinator.data.get("rssi"),
+            "Battery": data.get("battery_level"),
+            "RSSI": data.get("rssi"),
         }
 
     async def async_start(self) -> None:
         """Start the vacuum (dispense food)."""
-        _LOGGER.info("Starting vacuum (dispensing food)")
-        await self._device.dispense_food(1)
-        await self.coordinator.async_request_refresh()
+        _LOGGER.debug("Starting vacuum (dispensing food)")
+        async with self._action_lock:
+            await self._device.dispense_food(1)
+            # Reflect the action immediately and let the coordinator refresh
+            # land in the background instead of holding the service call open
+            # for the debounced refresh round-trip
+            self.async_write_ha_state()
+        self.hass.async_create_task(self.coordinator.async_request_refresh())
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
-        _LOGGER.info("Petlibro vacuum entity added: %s", self._attr_name)
+        _LOGGER.debug("Petlibro vacuum entity added: %s", self._attr_name)